@@ -0,0 +1,121 @@
+"""
+Compiled kernels for the aerial helpers
+These work on plain floats so Numba can compile them; util.aerial wraps them for Vec3 and packet objects
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, without it the kernels simply run as regular Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Module-level binding so the plain Python fallback skips the attribute lookup on math
+_acos = math.acos
+
+
+# cache=True stores the compiled code on disk, so only the very first run pays the compile cost
+# instead of every bot startup.
+
+@njit(cache=True, fastmath=True)
+def aerial_to_target_k(cx, cy, cz, tx, ty, tz, pitch, yaw, roll):
+    """
+    Pitch, yaw and roll controls to point a car at (cx, cy, cz) with the given rotation towards (tx, ty, tz)
+    """
+    # Vector from car to target
+    dx = tx - cx
+    dy = ty - cy
+    dz = tz - cz
+    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    if distance == 0:
+        return 0.0, 0.0, 0.0
+
+    dx /= distance
+    dy /= distance
+    dz /= distance
+
+    cp = math.cos(pitch)
+    sp = math.sin(pitch)
+    cyaw = math.cos(yaw)
+    syaw = math.sin(yaw)
+
+    # Forward direction
+    fx = cp * cyaw
+    fy = cp * syaw
+    fz = sp
+
+    # Up direction
+    ux = -sp * cyaw
+    uy = -sp * syaw
+    uz = cp
+
+    # Right direction (cross product of forward and up)
+    rx = fy * uz - fz * uy
+    ry = fz * ux - fx * uz
+    rz = fx * uy - fy * ux
+
+    pitch_control = dx * ux + dy * uy + dz * uz
+    yaw_control = dx * rx + dy * ry + dz * rz
+    roll_control = 0.0  # Keep level for now
+
+    return pitch_control, yaw_control, roll_control
+
+
+@njit(cache=True, fastmath=True)
+def car_facing_k(pitch, yaw):
+    """
+    Forward direction of a car with the given pitch and yaw
+    """
+    cp = math.cos(pitch)
+    return cp * math.cos(yaw), cp * math.sin(yaw), math.sin(pitch)
+
+
+@njit(cache=True, fastmath=True)
+def angle_between_k(x1, y1, z1, x2, y2, z2):
+    """
+    Angle between two vectors in radians
+    """
+    dot = x1 * x2 + y1 * y2 + z1 * z2
+    # The epsilon keeps zero-length vectors from dividing by zero, their dot product is 0 so they come out at pi/2
+    mag = math.sqrt(x1 * x1 + y1 * y1 + z1 * z1) * math.sqrt(x2 * x2 + y2 * y2 + z2 * z2) + 1e-12
+
+    cos_angle = dot / mag
+    # Clamp to avoid math domain errors
+    cos_angle = -1.0 if cos_angle < -1.0 else (1.0 if cos_angle > 1.0 else cos_angle)
+
+    return _acos(cos_angle)
+
+
+@njit(cache=True, fastmath=True)
+def time_to_reach_k(cx, cy, cz, tx, ty, tz, vx, vy, vz):
+    """
+    Rough estimate of time to drive from (cx, cy, cz) to (tx, ty, tz) with velocity (vx, vy, vz)
+    """
+    dx = tx - cx
+    dy = ty - cy
+    dz = tz - cz
+    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+    speed = math.sqrt(vx * vx + vy * vy + vz * vz)
+
+    if speed < 100:
+        speed = 1000.0  # Assume we'll boost
+
+    return distance / speed
+
+
+@njit(cache=True, fastmath=True)
+def boost_usage_k(distance, current_boost):
+    """
+    True if we have enough boost to cover the distance in the air
+    """
+    # Very rough calculation
+    # Assume we need about 10 boost per 100 units of distance in air
+    estimated_boost_needed = distance / 100 * 10
+
+    return current_boost > estimated_boost_needed
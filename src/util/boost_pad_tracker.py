@@ -1,10 +1,21 @@
+import ctypes
 from dataclasses import dataclass
 from typing import List
 
-from rlbot.utils.structures.game_data_struct import GameTickPacket, FieldInfoPacket
+import numpy as np
+from rlbot.utils.structures.game_data_struct import BoostPadState, GameTickPacket, FieldInfoPacket
 
 from util.vec import Vec3
 
+# Layout of the packet's BoostPadState struct. Spelled out instead of letting numpy derive it from the ctypes
+# format string, which is slow to parse every frame and makes numpy guess at the padding.
+_PAD_DTYPE = np.dtype({
+    'names': ['is_active', 'timer'],
+    'formats': ['?', '<f4'],
+    'offsets': [BoostPadState.is_active.offset, BoostPadState.timer.offset],
+    'itemsize': ctypes.sizeof(BoostPadState),
+})
+
 
 @dataclass
 class BoostPad:
@@ -19,25 +30,49 @@ class BoostPadTracker:
     This class merges together the boost pad location info with the is_active info so you can access it
     in one convenient list. For it to function correctly, you need to call initialize_boosts once when the
     game has started, and then update_boost_status every frame so that it knows which pads are active.
+
+    The per-frame update only copies the packet's pad states into numpy arrays. The BoostPad objects are
+    brought up to date from those arrays the next time someone asks for them.
     """
 
     def __init__(self):
-        self.boost_pads: List[BoostPad] = []
+        self._boost_pads: List[BoostPad] = []
         self._full_boosts_only: List[BoostPad] = []
+        self.pad_active = np.zeros(0, dtype=np.bool_)
+        self.pad_timers = np.zeros(0, dtype=np.float32)
+        self._pads_stale = False
 
     def initialize_boosts(self, game_info: FieldInfoPacket):
         raw_boosts = [game_info.boost_pads[i] for i in range(game_info.num_boosts)]
-        self.boost_pads: List[BoostPad] = [BoostPad(Vec3(rb.location), rb.is_full_boost, False, 0) for rb in raw_boosts]
+        self._boost_pads: List[BoostPad] = [BoostPad(Vec3(rb.location), rb.is_full_boost, False, 0) for rb in raw_boosts]
         # Cache the list of full boosts since they're commonly requested.
         # They reference the same objects in the boost_pads list.
-        self._full_boosts_only: List[BoostPad] = [bp for bp in self.boost_pads if bp.is_full_boost]
+        self._full_boosts_only: List[BoostPad] = [bp for bp in self._boost_pads if bp.is_full_boost]
+        self.pad_active = np.zeros(len(self._boost_pads), dtype=np.bool_)
+        self.pad_timers = np.zeros(len(self._boost_pads), dtype=np.float32)
+        self._pads_stale = False
 
     def update_boost_status(self, packet: GameTickPacket):
-        for i in range(packet.num_boost):
-            our_pad = self.boost_pads[i]
-            packet_pad = packet.game_boosts[i]
-            our_pad.is_active = packet_pad.is_active
-            our_pad.timer = packet_pad.timer
+        n = min(packet.num_boost, len(self._boost_pads))
+        # Zero-copy view of the packet's BoostPadState structs, with is_active and timer fields
+        packet_pads = np.frombuffer(packet.game_boosts, dtype=_PAD_DTYPE, count=n)
+        np.copyto(self.pad_active[:n], packet_pads['is_active'])
+        np.copyto(self.pad_timers[:n], packet_pads['timer'])
+        self._pads_stale = True
+
+    @property
+    def boost_pads(self) -> List[BoostPad]:
+        self._sync_pads()
+        return self._boost_pads
 
     def get_full_boosts(self) -> List[BoostPad]:
+        self._sync_pads()
         return self._full_boosts_only
+
+    def _sync_pads(self):
+        if not self._pads_stale:
+            return
+        for pad, is_active, timer in zip(self._boost_pads, self.pad_active.tolist(), self.pad_timers.tolist()):
+            pad.is_active = is_active
+            pad.timer = timer
+        self._pads_stale = False
@@ -1,5 +1,7 @@
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence as SequenceType, Tuple
 
 from rlbot.agents.base_agent import SimpleControllerState
 from rlbot.utils.structures.game_data_struct import GameTickPacket
@@ -12,6 +14,9 @@ class StepResult:
 
 
 class Step:
+    # https://docs.python.org/3/reference/datamodel.html#slots
+    __slots__ = ()
+
     def tick(self, packet: GameTickPacket) -> StepResult:
         """
         Return appropriate controls for this step in the sequence. If the step is over, you should
@@ -27,6 +32,12 @@ class ControlStep(Step):
     This allows you to repeat the same controls every frame for some specified duration. It's useful for
     scheduling the button presses needed for kickoffs / dodges / etc.
     """
+    __slots__ = [
+        'duration',
+        'controls',
+        'start_time'
+    ]
+
     def __init__(self, duration: float, controls: SimpleControllerState):
         self.duration = duration
         self.controls = controls
@@ -40,6 +51,12 @@ class ControlStep(Step):
 
 
 class Sequence:
+    __slots__ = [
+        'steps',
+        'index',
+        'done'
+    ]
+
     def __init__(self, steps: List[Step]):
         self.steps = steps
         self.index = 0
@@ -61,3 +78,42 @@ class Sequence:
         # If we reach here, we ran out of steps to attempt.
         self.done = True
         return None
+
+
+class TimedSequence:
+    """
+    Equivalent to a Sequence made only of ControlSteps, built from (duration, controls) pairs. The end time of
+    every step is computed up front, so each tick finds the current controls with one bisect instead of
+    ticking through the steps.
+
+    Like ControlStep, a step stays active while the elapsed time is <= its end time. Once the total duration
+    has passed, tick returns None and done is set.
+    """
+    __slots__ = [
+        'step_ends',
+        'step_controls',
+        'start_time',
+        'done'
+    ]
+
+    def __init__(self, steps: SequenceType[Tuple[float, SimpleControllerState]]):
+        self.step_ends = array('d')
+        total = 0.0
+        for duration, _ in steps:
+            total += duration
+            self.step_ends.append(total)
+        self.step_controls = [controls for _, controls in steps]
+        self.start_time: float = None
+        self.done = False
+
+    def tick(self, packet: GameTickPacket):
+        if self.start_time is None:
+            self.start_time = packet.game_info.seconds_elapsed
+        elapsed_time = packet.game_info.seconds_elapsed - self.start_time
+        # The tolerance keeps ticks that land exactly on a step's end in that step, whatever rounding
+        # the subtraction from the start time introduced
+        index = bisect_left(self.step_ends, elapsed_time - 1e-6)
+        if index >= len(self.step_controls):
+            self.done = True
+            return None
+        return self.step_controls[index]
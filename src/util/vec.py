@@ -106,4 +106,5 @@ class Vec3:
     def ang_to(self, ideal: 'Vec3') -> float:
         """Returns the angle to the ideal vector. Angle will be between 0 and pi."""
         cos_ang = self.dot(ideal) / (self.length() * ideal.length())
-        return math.acos(cos_ang)
+        # Rounding can push parallel vectors slightly outside acos's domain
+        return math.acos(-1.0 if cos_ang < -1.0 else (1.0 if cos_ang > 1.0 else cos_ang))